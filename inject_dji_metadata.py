@@ -7,77 +7,226 @@ import argparse
 import subprocess
 import datetime
 import shutil
+import sys
+import queue
 
 import threading
 from concurrent.futures import ThreadPoolExecutor
 
+# Optional: send2trash moves files to the Recycle Bin without a PowerShell round-trip
+try:
+    import send2trash
+except ImportError:
+    send2trash = None
+
 # Global tracking set for processed files (loaded in main)
 _processed_set = set()
 
-# Lock for clean console output during multi-threading
-print_lock = threading.Lock()
+# Parsed SRT metadata keyed by SRT path, with the mtime/size it was parsed at (loaded in main)
+_srt_cache = {}
+
+# Console output from worker threads is queued and written by a single logger
+# thread, so workers never wait on each other to print (started in main)
+_log_queue = queue.Queue()
+_log_thread = None
+
+# Per-worker-thread state for the SSD cooldown (whether this worker has rewritten a file)
+_worker_state = threading.local()
+
+# Persistent exiftool process (started in main)
+_exiftool = None
+
+# Tags and options identical for every video. Passed once as -common_args when
+# the exiftool process starts instead of being rebuilt and re-parsed per file.
+_STATIC_EXIFTOOL_ARGS = (
+    # -overwrite_original_in_place is deliberately not used: exiftool still writes a
+    # full temp copy and then copies it back over the original, doubling the I/O
+    '-overwrite_original',
+    '-api', 'largefilesupport=1', # DJI 4K clips often exceed 4 GB
+    '-q', # No "1 image files updated" chatter; errors still go to stderr
+    
+    # Camera Info
+    '-Make=DJI',
+    '-Model=DJI Mini 3 Pro',
+    '-Keys:Make=DJI',
+    '-Keys:Model=DJI Mini 3 Pro',
+    
+    # Searchability
+    '-Keywords=Drone; DJI; Mini 3 Pro; Telemetry',
+    '-Keys:Keywords=Drone; DJI; Mini 3 Pro; Telemetry',
+    '-XMP:GPSAltitudeRef=Above Sea Level',
+)
+
+# SRT field pattern, compiled once at import (bytes, so SRTs need no UTF-8 decode).
+# One alternation covers every field so the buffer is scanned in a single pass;
+# each field keeps its own value grammar, so malformed values are skipped:
+#   [iso : 100] [shutter : 1/160.0] [fnum : 170] [latitude: 47.12345] [longitude: ...]
+#   abs_alt: 120.500
+#   2025-08-09 18:53:47.246
+_RE_SRT_FIELD = re.compile(
+    rb'\[(latitude|longitude)\s*:\s*([-+]?\d*\.\d+|\d+)\]'
+    rb'|\[(iso|fnum)\s*:\s*(\d+)\]'
+    rb'|\[shutter\s*:\s*([^\]]+)\]'
+    rb'|abs_alt:\s*([-+]?\d*\.\d+|\d+)'
+    rb'|(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})'
+)
+_SRT_KEYS = ('datetime', 'latitude', 'longitude', 'altitude', 'iso', 'shutter', 'fnum')
+
+# How much of an SRT to read before falling back to the whole file
+_SRT_HEAD_BYTES = 8192
 
 def safe_print(message):
-    with print_lock:
+    if _log_thread is None:
         print(message)
+    else:
+        _log_queue.put(f"{message}\n")
+
+def _log_writer():
+    while True:
+        message = _log_queue.get()
+        if message is None:
+            break
+        sys.stdout.write(message)
+        sys.stdout.flush()
+
+def start_logger():
+    """Starts the logger thread that drains safe_print messages."""
+    global _log_thread
+    _log_thread = threading.Thread(target=_log_writer, daemon=True)
+    _log_thread.start()
+
+def stop_logger():
+    """Flushes all queued messages and stops the logger thread."""
+    global _log_thread
+    if _log_thread is not None:
+        _log_queue.put(None)
+        _log_thread.join()
+        _log_thread = None
+
+class ExifToolDaemon:
+    """
+    Keeps a single exiftool process alive (-stay_open) and streams commands to it,
+    so the Perl interpreter/module load cost is paid once per run instead of per video.
+    common_args are appended by exiftool to every command sent to this process.
+    """
+    def __init__(self, common_args=()):
+        # -common_args must come last; utf8 filenames since args arrive via the arg stream
+        self._proc = subprocess.Popen(
+            ['exiftool', '-stay_open', 'True', '-@', '-',
+             '-common_args', '-charset', 'filename=utf8', *common_args],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        self._lock = threading.Lock()
+        self._seq = 0
+
+    def execute(self, args):
+        """
+        Runs one command on the exiftool process and returns (stdout, stderr, status),
+        where status is exiftool's exit status for the command (0 = success).
+        If exiftool has exited or exits before answering, status is None.
+        """
+        with self._lock:
+            self._seq += 1
+            sentinel = f"{{ready{self._seq}}}"
+            # -echo4 prints the sentinel plus the command's exit status to stderr
+            # once the command finishes, -executeN prints the sentinel to stdout
+            payload = list(args) + ['-echo4', sentinel + ' ${status}', f'-execute{self._seq}']
+            try:
+                self._proc.stdin.write(("\n".join(payload) + "\n").encode('utf-8'))
+                self._proc.stdin.flush()
+                stdout, _ = self._read_until(self._proc.stdout, sentinel)
+                stderr, status = self._read_until(self._proc.stderr, sentinel)
+            except (OSError, EOFError):
+                return '', 'exiftool exited unexpectedly', None
+        try:
+            status = int(status)
+        except ValueError:
+            status = None
+        return stdout, stderr, status
+
+    @staticmethod
+    def _read_until(stream, sentinel):
+        """
+        Reads lines until one starting with sentinel. Returns (text before it,
+        rest of the sentinel line). Raises EOFError if the stream closes first.
+        """
+        output = []
+        for raw in iter(stream.readline, b''):
+            line = raw.decode('utf-8', errors='replace').rstrip('\r\n')
+            if line == sentinel or line.startswith(sentinel + ' '):
+                return ''.join(output), line[len(sentinel):].strip()
+            output.append(line + '\n')
+        raise EOFError(f"exiftool closed its output before {sentinel}")
+
+    def close(self):
+        """Tells exiftool to exit and waits for it."""
+        try:
+            self._proc.stdin.write(b"-stay_open\nFalse\n")
+            self._proc.stdin.flush()
+            self._proc.wait(timeout=10)
+        except Exception:
+            self._proc.kill()
+
+def _extract_srt_fields(content):
+    """
+    Scans a bytes buffer once for the SRT fields and returns whatever was found.
+    The first occurrence of each field wins, matching the first record.
+    """
+    data = {}
+    
+    for match in _RE_SRT_FIELD.finditer(content):
+        coord_key, coord, int_key, int_value, shutter, alt, date = match.groups()
+        if date is not None:
+            # First timestamp block (e.g., 2025-08-09 18:53:47.246)
+            data.setdefault('datetime', date.decode('ascii'))
+        elif alt is not None:
+            data.setdefault('altitude', float(alt))
+        elif coord_key is not None:
+            data.setdefault(coord_key.decode('ascii'), float(coord))
+        elif int_key == b'iso':
+            data.setdefault('iso', int_value.decode('ascii'))
+        elif int_key == b'fnum':
+            # F-stop is usually multiplied by 100 (e.g. 170 = f/1.7)
+            data.setdefault('fnum', float(int_value) / 100.0)
+        elif 'shutter' not in data:
+            shutter_raw = shutter.decode('utf-8', errors='replace')
+            # Clean up "1/160.0" -> "1/160"
+            if ".0" in shutter_raw:
+                 data['shutter'] = shutter_raw.replace('.0', '')
+            else:
+                 data['shutter'] = shutter_raw
+        
+        if len(data) == len(_SRT_KEYS):
+            break
+    
+    # Coordinates are only usable as a pair
+    if 'latitude' not in data or 'longitude' not in data:
+        data.pop('latitude', None)
+        data.pop('longitude', None)
+    
+    return data
 
 def parse_srt_data(srt_path):
     """
     Parses a DJI SRT file to extract the first valid GPS coordinate, timestamp,
     and camera settings (ISO, Shutter, F-stop).
+    Only the start of the file is read; the first record is all we need.
     Returns a dictionary with 'latitude', 'longitude', 'datetime', 'iso', 'shutter', 'fnum'.
     """
-    data = {}
-    
     try:
-        with open(srt_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-            # Find the first timestamp block (e.g., 2025-08-09 18:53:47.246)
-            # Regex for Date/Time
-            date_match = re.search(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', content)
-            if date_match:
-                data['datetime'] = date_match.group(1)
-            
-            # Regex for GPS and Altitude
-            lat_match = re.search(r'\[latitude\s*:\s*([-+]?\d*\.\d+|\d+)\]', content)
-            lon_match = re.search(r'\[longitude\s*:\s*([-+]?\d*\.\d+|\d+)\]', content)
-            alt_match = re.search(r'abs_alt:\s*([-+]?\d*\.\d+|\d+)', content)
+        with open(srt_path, 'rb') as f:
+            # DJI SRTs can be several MB, but the first record is well under 1 KiB
+            content = f.read(_SRT_HEAD_BYTES)
+            data = _extract_srt_fields(content)
             
-            if lat_match and lon_match:
-                data['latitude'] = float(lat_match.group(1))
-                data['longitude'] = float(lon_match.group(1))
-            
-            if alt_match:
-                data['altitude'] = float(alt_match.group(1))
-
-            # Regex for Camera Settings
-            # [iso : 100] [shutter : 1/160.0] [fnum : 170]
-            iso_match = re.search(r'\[iso\s*:\s*(\d+)\]', content)
-            shutter_match = re.search(r'\[shutter\s*:\s*([^\]]+)\]', content)
-            fnum_match = re.search(r'\[fnum\s*:\s*(\d+)\]', content)
-
-            if iso_match:
-                data['iso'] = iso_match.group(1)
-            
-            if shutter_match:
-                shutter_raw = shutter_match.group(1)
-                # Clean up "1/160.0" -> "1/160"
-                if ".0" in shutter_raw:
-                     data['shutter'] = shutter_raw.replace('.0', '')
-                else:
-                     data['shutter'] = shutter_raw
-
-            if fnum_match:
-                # F-stop is usually multiplied by 100 (e.g. 170 = f/1.7)
-                try:
-                    f_val = float(fnum_match.group(1))
-                    data['fnum'] = f_val / 100.0
-                except ValueError:
-                    pass
+            # Unusual layout: fall back to scanning the whole file
+            if not all(key in data for key in ('datetime', 'latitude', 'longitude')):
+                rest = f.read()
+                if rest:
+                    data = _extract_srt_fields(content + rest)
                 
     except Exception as e:
-        print(f"Error parsing SRT {srt_path}: {e}")
+        safe_print(f"Error parsing SRT {srt_path}: {e}")
         return None
 
     if 'latitude' in data and 'longitude' in data:
@@ -85,6 +234,28 @@ def parse_srt_data(srt_path):
     return None
 
 
+def get_srt_metadata(srt_path):
+    """
+    Returns parse_srt_data() for the SRT, reusing the cached result when the
+    file's mtime and size are unchanged since it was last parsed.
+    """
+    key = os.path.abspath(srt_path)
+    try:
+        stat = os.stat(srt_path)
+    except OSError:
+        return parse_srt_data(srt_path)
+    
+    # Anything malformed (e.g. a hand-edited cache file) is treated as a miss
+    entry = _srt_cache.get(key)
+    if (isinstance(entry, dict) and entry.get('mtime') == stat.st_mtime
+            and entry.get('size') == stat.st_size and isinstance(entry.get('metadata'), dict)):
+        return dict(entry['metadata'])
+    
+    metadata = parse_srt_data(srt_path)
+    if metadata:
+        _srt_cache[key] = {'mtime': stat.st_mtime, 'size': stat.st_size, 'metadata': metadata}
+    return metadata
+
 def format_iso6709(lat, lon, alt):
     """
     Formats coordinates as ISO 6709 string: +DD.DDdd+DDD.DDdd+AAA.AAA/
@@ -96,14 +267,11 @@ def format_iso6709(lat, lon, alt):
     
     return f"{lat_sign}{abs(lat):08.5f}{lon_sign}{abs(lon):09.5f}{alt_sign}{abs(alt):08.3f}/"
 
-def inject_metadata(video_path, metadata):
+def build_exiftool_args(video_path, metadata):
     """
-    Uses exiftool to inject GPS and Date metadata into the video file.
-    Optimized for Google Photos recognition.
+    Builds the per-file exiftool arguments for one video.
+    Constant DJI tags are not included; they are sent once as -common_args (_STATIC_EXIFTOOL_ARGS).
     """
-    if not metadata:
-        return
-
     # Format datetime for exiftool (YYYY:MM:DD HH:MM:SS)
     dt_str = metadata['datetime'].replace('-', ':')
     
@@ -118,28 +286,16 @@ def inject_metadata(video_path, metadata):
     
     # Metadata Summary for Description/Comments
     cam_summary = f"DJI Mini 3 Pro | ISO {metadata.get('iso','?')}, {metadata.get('shutter','?')}, f/{metadata.get('fnum','')}"
-    keywords = "Drone; DJI; Mini 3 Pro; Telemetry"
     
-    # Construct exiftool command
+    # Construct exiftool arguments (sent to the persistent exiftool process)
     # Google Photos prefers the 'Keys' group for MP4 metadata, especially for GPS.
     # It also likes standard ISO 6709 formatting for location.
     
     cmd = [
-        'exiftool',
-        '-overwrite_original',
-        
-        # Camera Info
-        '-Make=DJI',
-        '-Model=DJI Mini 3 Pro',
-        '-Keys:Make=DJI',
-        '-Keys:Model=DJI Mini 3 Pro',
-        
         # Description/Searchability (Visible in Explorer/Finder/Google Photos)
         f'-Description={cam_summary}',
         f'-UserComment={cam_summary}',
         f'-Keys:Description={cam_summary}',
-        f'-Keywords={keywords}',
-        f'-Keys:Keywords={keywords}',
         f'-Keys:DisplayName={os.path.basename(video_path)}',
         
         # Date/Time (CreationDate in Keys is critical for Google Photos)
@@ -160,25 +316,27 @@ def inject_metadata(video_path, metadata):
         f'-XMP:GPSLatitude={lat}',
         f'-XMP:GPSLongitude={lon}',
         f'-XMP:GPSAltitude={alt}',
-        '-XMP:GPSAltitudeRef=Above Sea Level',
         
         video_path
     ]
 
     # Add optional camera settings if found
     if 'iso' in metadata:
-        cmd.insert(2, f'-ISO={metadata["iso"]}')
+        cmd.insert(0, f'-ISO={metadata["iso"]}')
     if 'shutter' in metadata:
-        cmd.insert(2, f'-ExposureTime={metadata["shutter"]}')
+        cmd.insert(0, f'-ExposureTime={metadata["shutter"]}')
     if 'fnum' in metadata:
-        cmd.insert(2, f'-FNumber={metadata["fnum"]}')
-    
-    safe_print(f"  Injecting metadata into {os.path.basename(video_path)}...")
-    safe_print(f"    Date: {dt_str}")
-    safe_print(f"    GPS: {lat}, {lon} (Alt: {metadata.get('altitude', 'N/A')}m)")
-    if 'iso' in metadata:
-        safe_print(f"    Cam: ISO {metadata['iso']}, {metadata.get('shutter','')}, f/{metadata.get('fnum','')}")
+        cmd.insert(0, f'-FNumber={metadata["fnum"]}')
     
+    return cmd
+
+def inject_metadata(video_path, metadata):
+    """
+    Uses exiftool to inject GPS and Date metadata into the video file
+    through the persistent exiftool process.
+    Optimized for Google Photos recognition.
+    Returns True if the write succeeded.
+    """
     # Cleanup any leftover exiftool temp files
     tmp_path = video_path + "_exiftool_tmp"
     if os.path.exists(tmp_path):
@@ -187,20 +345,80 @@ def inject_metadata(video_path, metadata):
             safe_print(f"    Cleaned up leftover temp file: {os.path.basename(tmp_path)}")
         except Exception as e:
             safe_print(f"    Warning: Could not remove {tmp_path}: {e}")
+    
+    safe_print(f"  Injecting metadata into {os.path.basename(video_path)}...")
+    safe_print(f"    Date: {metadata['datetime'].replace('-', ':')}")
+    safe_print(f"    GPS: {metadata['latitude']}, {metadata['longitude']} (Alt: {metadata.get('altitude', 'N/A')}m)")
+    if 'iso' in metadata:
+        safe_print(f"    Cam: ISO {metadata['iso']}, {metadata.get('shutter','')}, f/{metadata.get('fnum','')}")
+    
+    _, stderr, status = _exiftool.execute(build_exiftool_args(video_path, metadata))
+    if status != 0:
+        safe_print(f"    Error running exiftool (status {status}): {stderr}")
+        return False
+    safe_print("    Success!")
+    return True
+
+def scan_files(root_dir, extensions):
+    """
+    Recursively yields (dir_path, filename) for files under root_dir whose lowercase
+    extension is in extensions. Uses os.scandir, whose entries carry the file type
+    from the directory listing, so no extra stat per entry is needed on Windows.
+    Visits directories in the same top-down order as os.walk; unreadable ones are skipped.
+    """
+    pending = [root_dir]
+    while pending:
+        current = pending.pop()
+        subdirs = []
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Like os.walk, don't follow directory symlinks
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in extensions:
+                        yield current, entry.name
+        except OSError:
+            continue
+        pending.extend(reversed(subdirs))
+
+def index_source_dir(src_dir, source_map):
+    """
+    Fills source_map with {base_name: (srt_path, source_video)} for every SRT under
+    src_dir, where source_video is the original MP4/MOV next to the SRT (normalized,
+    for --delete-source) or None if absent.
+    """
+    srt_paths = {}
+    source_videos = {}
+    for root, filename in scan_files(src_dir, ('.srt', '.mp4', '.mov')):
+        base_name, ext = os.path.splitext(filename.lower())
+        if ext == '.srt':
+            srt_paths[base_name] = (root, filename)
+        else:
+            # Prefer MP4 over MOV when both exist
+            if ext == '.mp4' or (root, base_name) not in source_videos:
+                source_videos[(root, base_name)] = os.path.normpath(os.path.join(root, filename))
+    
+    # Key on the scan root itself: dirname() of the joined path drops a trailing separator
+    for base_name, (root, filename) in srt_paths.items():
+        source_map[base_name] = (os.path.join(root, filename), source_videos.get((root, base_name)))
 
+def queue_export_videos(export_dir, export_queue):
+    """Puts (dir_path, filename) for every MP4/MOV under export_dir on the queue, then None."""
     try:
-        subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        safe_print("    Success!")
-    except subprocess.CalledProcessError as e:
-        safe_print(f"    Error running exiftool: {e.stderr.decode()}")
+        for entry in scan_files(export_dir, ('.mp4', '.mov')):
+            export_queue.put(entry)
+    finally:
+        export_queue.put(None)
 
 def check_ffmpeg():
     """Checks if ffmpeg is available in the system PATH."""
-    try:
-        subprocess.run(['ffmpeg', '-version'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    return shutil.which('ffmpeg') is not None
+
+def check_exiftool():
+    """Checks if exiftool is available in the system PATH."""
+    return shutil.which('exiftool') is not None
 
 def embed_subtitle(video_path, srt_path, metadata=None):
     """
@@ -217,8 +435,11 @@ def embed_subtitle(video_path, srt_path, metadata=None):
     # -c copy (copy video/audio streams)
     # -c:s mov_text (convert srt to mp4 compatible subtitle)
     # -movflags +faststart (move moov atom to start for better playback/seeking)
+    # -hide_banner -loglevel error -nostats (stderr is captured for error reports only,
+    #   so don't let ffmpeg fill it with banner/progress output on success)
     cmd = [
         'ffmpeg', '-y', # Overwrite temp if exists
+        '-hide_banner', '-loglevel', 'error', '-nostats',
         '-i', video_path,
         '-i', srt_path,
         '-c', 'copy',
@@ -238,8 +459,8 @@ def embed_subtitle(video_path, srt_path, metadata=None):
     try:
         subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
         
-        # If successful, replace original with temp
-        shutil.move(temp_output, video_path)
+        # If successful, replace original with temp (same directory, so a single atomic rename)
+        os.replace(temp_output, video_path)
         safe_print("  Subtitle embedding successful!")
         return True
     except subprocess.CalledProcessError as e:
@@ -253,129 +474,157 @@ def embed_subtitle(video_path, srt_path, metadata=None):
             os.remove(temp_output)
         return False
 
-def check_if_processed(video_path):
+def check_if_processed(video_paths, has_ffmpeg):
     """
-    Checks if the video has already been processed by looking for specific metadata.
-    Uses a tracking file first for near-instant checks, then falls back to exiftool.
-    Returns True if valid DJI metadata or subtitle track is found.
+    Checks which videos have already been processed by looking for specific metadata.
+    Uses a tracking file first for near-instant checks, then a single exiftool scan
+    over all remaining files, then ffprobe only for files exiftool didn't confirm.
+    has_ffmpeg is the result of check_ffmpeg() from main, so it isn't re-checked here.
+    Returns the set of paths where valid DJI metadata or a subtitle track is found.
     """
     # Fast path: check in-memory tracking set (loaded from .dji_processed.json)
-    if os.path.basename(video_path) in _processed_set:
-        return True
+    processed = {path for path in video_paths if os.path.basename(path) in _processed_set}
+    remaining = [path for path in video_paths if path not in processed]
+    if not remaining:
+        return processed
     
     try:
-        # Check for our injected Model tag (-fast reads only file header, much less I/O)
+        # Check for our injected Model tag in one exiftool call for every file
+        # (-fast reads only file header; file list goes through stdin to avoid argv length limits)
         result = subprocess.run(
-            ['exiftool', '-fast', '-Model', '-s3', video_path],
-            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+            ['exiftool', '-j', '-fast', '-Model', '-api', 'largefilesupport=1',
+             '-charset', 'filename=utf8', '-@', '-'],
+            input="\n".join(remaining), stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, encoding='utf-8'
         )
-        model = result.stdout.strip()
-        if "DJI Mini 3 Pro" in model:
-            _processed_set.add(os.path.basename(video_path))
-            return True
-            
-        # Check for Telemetry subtitle track using ffprobe (if available)
-        if check_ffmpeg():
-            cmd = [
-                'ffprobe', '-v', 'error', '-select_streams', 's', 
-                '-show_entries', 'stream_tags=title', 
-                '-of', 'default=noprint_wrappers=1:nokey=1', 
-                video_path
-            ]
-            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
-            if "DJI Telemetry" in result.stdout:
-                _processed_set.add(os.path.basename(video_path))
-                return True
-                
+        models = {}
+        for entry in json.loads(result.stdout or '[]'):
+            key = os.path.normcase(os.path.normpath(entry.get('SourceFile', '')))
+            models[key] = str(entry.get('Model', ''))
+        for path in remaining:
+            if "DJI Mini 3 Pro" in models.get(os.path.normcase(os.path.normpath(path)), ''):
+                processed.add(path)
     except Exception:
         pass
-        
-    return False
-
-from concurrent.futures import ThreadPoolExecutor
+    
+    # Check for Telemetry subtitle track using ffprobe (if available)
+    if has_ffmpeg:
+        for path in remaining:
+            if path in processed:
+                continue
+            try:
+                cmd = [
+                    'ffprobe', '-v', 'error', '-select_streams', 's', 
+                    '-show_entries', 'stream_tags=title', 
+                    '-of', 'default=noprint_wrappers=1:nokey=1', 
+                    path
+                ]
+                result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+                if "DJI Telemetry" in result.stdout:
+                    processed.add(path)
+            except Exception:
+                pass
+    
+    for path in processed:
+        _processed_set.add(os.path.basename(path))
+    return processed
 
 def process_single_video(video_info):
-    """Worker function for parallel processing."""
-    export_path, matched_srt, has_ffmpeg, force, delete_source, source_map, video_count, current_idx, no_subtitle = video_info
+    """
+    Worker function for parallel processing.
+    Embeds the subtitle track, then immediately writes the tags through the shared
+    exiftool process, so an interrupted run never leaves remuxed files without GPS/date.
+    Returns a (status, entry) pair: status is "success", "already_processed" or "error",
+    and entry is (filename, datetime, "lat,lon") for the summary log on success.
+    """
+    export_path, matched_srt, has_ffmpeg, processed_paths, delete_source, source_video, video_count, current_idx, no_subtitle, delay = video_info
     filename = os.path.basename(export_path)
     
     safe_print(f"[{current_idx}/{video_count}] Processing {filename}...")
     
-    # Check if already processed
-    if not force and check_if_processed(export_path):
+    # Check if already processed (determined upfront for all videos in main)
+    if export_path in processed_paths:
         # We still might want to recycle the source even if the export is already matched/processed
         if delete_source:
-             recycle_source(matched_srt, export_path)
-        return "already_processed"
+             recycle_source(source_video, export_path)
+        return "already_processed", None
     
     # 0. Parse metadata first (needed for both ffmpeg and exiftool)
-    metadata = parse_srt_data(matched_srt)
-    if not metadata:
+    metadata = get_srt_metadata(matched_srt)
+    if not metadata or 'datetime' not in metadata:
         safe_print(f"  Warning: Could not extract metadata from {os.path.basename(matched_srt)}")
-        return "error"
+        return "error", None
+    
+    # Cooldown delay to reduce sustained SSD heat: sleep before this worker's
+    # next rewrite if it already rewrote a file, so the last file never waits
+    if delay > 0 and getattr(_worker_state, 'rewrote', False):
+        safe_print(f"  Cooling down {delay}s before {filename}...")
+        time.sleep(delay)
+    _worker_state.rewrote = False
     
     # 1. Embed Subtitle (pass metadata so ffmpeg can set creation_time in same pass)
     srt_ok = True
+    remuxed = False
     if has_ffmpeg and not no_subtitle:
         srt_ok = embed_subtitle(export_path, matched_srt, metadata)
+        remuxed = srt_ok
+    
+    # 2. Inject Metadata via exiftool (one round-trip to the persistent process)
+    injected = inject_metadata(export_path, metadata)
+    
+    # Only an actual rewrite earns a cooldown before this worker's next file
+    _worker_state.rewrote = remuxed or injected
     
-    # 2. Inject Metadata via exiftool
-    inject_metadata(export_path, metadata)
-    final_status = f"success|{filename}|{metadata.get('datetime','?')}|{metadata.get('latitude',0)},{metadata.get('longitude',0)}"
+    if not injected:
+        return "error", None
     
     # Track as processed for fast future checks
     _processed_set.add(filename)
     
     # 3. Delete Source (Create Space)
     if delete_source and srt_ok:
-        recycle_source(matched_srt, export_path)
+        recycle_source(source_video, export_path)
 
-    return final_status
+    return "success", (filename, metadata.get('datetime','?'), f"{metadata.get('latitude',0)},{metadata.get('longitude',0)}")
 
-def recycle_source(matched_srt, export_path):
-    """Locates the source video file for an SRT and moves it to the Recycle Bin."""
-    src_dir = os.path.dirname(matched_srt)
-    src_base = os.path.splitext(os.path.basename(matched_srt))[0]
-    
-    # Check for MP4 or MOV
-    potential_srcs = [
-        os.path.join(src_dir, src_base + ".MP4"),
-        os.path.join(src_dir, src_base + ".mp4"),
-        os.path.join(src_dir, src_base + ".MOV"),
-        os.path.join(src_dir, src_base + ".mov")
-    ]
+def recycle_source(source_video, export_path):
+    """
+    Moves the original source video (indexed next to its SRT in main, already
+    normalized) to the Recycle Bin. Does nothing if no source video was found.
+    """
+    if not source_video:
+        return
     
-    for src_vid in potential_srcs:
-        if os.path.exists(src_vid):
-            # SAFETY: Ensure we aren't deleting the export file itself!
-            if os.path.normpath(src_vid) == os.path.normpath(export_path):
-                return
-                
-            try:
-                # Use the VisualBasic Shell API for moving to Recycle Bin (more robust than Remove-Item -Recycle)
-                # We escape double quotes in the path for the PowerShell string
-                escaped_path = src_vid.replace('"', '`"')
-                cmd_recycle = [
-                    'powershell', 
-                    '-Command', 
-                    f'Add-Type -AssemblyName Microsoft.VisualBasic; [Microsoft.VisualBasic.FileIO.FileSystem]::DeleteFile("{escaped_path}", "OnlyErrorDialogs", "SendToRecycleBin")'
-                ]
-                subprocess.run(cmd_recycle, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
-                safe_print(f"  [SPACE SAVER] Moved original source to Recycle Bin: {os.path.basename(src_vid)}")
-                return
-            except Exception as e:
-                safe_print(f"  Error moving source to Recycle Bin {src_vid}: {e}")
-                return
+    # SAFETY: Ensure we aren't deleting the export file itself!
+    if source_video == os.path.normpath(export_path):
+        return
+        
+    try:
+        if send2trash is not None:
+            send2trash.send2trash(source_video)
+        else:
+            # Use the VisualBasic Shell API for moving to Recycle Bin (more robust than Remove-Item -Recycle)
+            # We escape double quotes in the path for the PowerShell string
+            escaped_path = source_video.replace('"', '`"')
+            cmd_recycle = [
+                'powershell', 
+                '-Command', 
+                f'Add-Type -AssemblyName Microsoft.VisualBasic; [Microsoft.VisualBasic.FileIO.FileSystem]::DeleteFile("{escaped_path}", "OnlyErrorDialogs", "SendToRecycleBin")'
+            ]
+            subprocess.run(cmd_recycle, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        safe_print(f"  [SPACE SAVER] Moved original source to Recycle Bin: {os.path.basename(source_video)}")
+    except Exception as e:
+        safe_print(f"  Error moving source to Recycle Bin {source_video}: {e}")
 
 def main():
     parser = argparse.ArgumentParser(description="Inject DJI GPS data from SRT files into exported videos.")
     parser.add_argument('src_dir', help="Directory containing original source files (MP4 + SRT)")
     parser.add_argument('export_dir', help="Directory containing exported videos to process")
     parser.add_argument('--force', action='store_true', help="Force processing even if already processed")
-    parser.add_argument('--threads', type=int, default=1, help="Number of concurrent threads (default: 1)")
+    parser.add_argument('--threads', type=int, default=min(os.cpu_count() or 1, 8), help="Number of concurrent threads (default: CPU count, max 8)")
     parser.add_argument('--delete-source', action='store_true', help="Delete original source MP4/MOV after successful injection (Keeps SRT)")
     parser.add_argument('--no-subtitle', action='store_true', help="Skip ffmpeg subtitle embedding (metadata only, halves disk I/O)")
-    parser.add_argument('--delay', type=int, default=5, help="Seconds to wait between files to let SSD cool down (default: 5, 0 to disable)")
+    parser.add_argument('--delay', type=int, default=5, help="Seconds each worker thread waits between files it rewrites, to let the SSD cool down (default: 5, 0 to disable). With --threads N, up to N files are still rewritten at once; use --threads 1 for a real pause between every file")
     
     args = parser.parse_args()
     
@@ -396,6 +645,18 @@ def main():
         except Exception:
             _processed_set = set()
     
+    # Load parsed SRT cache so unchanged SRTs aren't re-read on re-runs
+    global _srt_cache
+    cache_path = os.path.join(export_dir, ".dji_inject_cache.json")
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                _srt_cache = json.load(f)
+        except Exception:
+            _srt_cache = {}
+        if not isinstance(_srt_cache, dict):
+            _srt_cache = {}
+    
     if delete_source:
         print("\n!!! WARNING: --delete-source is ENABLED !!!")
         print("Original source video files will be moved to the RECYCLE BIN after successful matching.")
@@ -411,6 +672,10 @@ def main():
     else:
         print(f"\nFFmpeg NOT detected. Skipping subtitle embedding (metadata only).")
     
+    if not check_exiftool():
+        print("ExifTool not found. Make sure exiftool is in your system PATH.")
+        return
+    
     if not os.path.exists(src_dir):
         print(f"Source directory not found: {src_dir}")
         return
@@ -418,40 +683,47 @@ def main():
         print(f"Export directory not found: {export_dir}")
         return
 
-    # Map source filenames (without extension) to their SRT paths
+    # Walk source and export trees concurrently (slow network/USB drives overlap).
+    # The source map must be complete before matching, so join it first; export
+    # entries are consumed from the queue as they arrive.
     source_map = {}
+    export_queue = queue.Queue()
     print(f"Scanning source directory: {src_dir} ...")
-    for root, dirs, files in os.walk(src_dir):
-        for filename in files:
-            if filename.lower().endswith('.srt'):
-                base_name = os.path.splitext(filename)[0].lower()
-                source_map[base_name] = os.path.join(root, filename)
+    print(f"Scanning export directory: {export_dir} ...")
+    source_thread = threading.Thread(target=index_source_dir, args=(src_dir, source_map))
+    export_thread = threading.Thread(target=queue_export_videos, args=(export_dir, export_queue))
+    source_thread.start()
+    export_thread.start()
+    source_thread.join()
             
     print(f"Found {len(source_map)} SRT templates in source directory tree.")
 
+    # Sorted once for substring matching of edited export names
+    sorted_keys = sorted(source_map, key=len, reverse=True)
+
     # Find all videos to process
     videos_to_process = []
-    print(f"Scanning export directory: {export_dir} ...")
-    for root, dirs, files in os.walk(export_dir):
-        for filename in files:
-            if filename.lower().endswith(('.mp4', '.mov')):
-                export_path = os.path.join(root, filename)
-                if "_exiftool_tmp" in export_path or "temp_" in filename:
-                    continue # Skip our own temp files
-                    
-                base_name = os.path.splitext(filename)[0].lower()
-                
-                matched_srt = None
-                if base_name in source_map:
-                    matched_srt = source_map[base_name]
-                else:
-                    matches = [key for key in source_map.keys() if key in base_name]
-                    if matches:
-                        best_match = sorted(matches, key=len, reverse=True)[0]
-                        matched_srt = source_map[best_match]
-                
-                if matched_srt:
-                    videos_to_process.append((export_path, matched_srt))
+    for root, filename in iter(export_queue.get, None):
+        export_path = os.path.join(root, filename)
+        if "_exiftool_tmp" in export_path or "temp_" in filename:
+            continue # Skip our own temp files
+            
+        base_name = os.path.splitext(filename)[0].lower()
+        
+        matched = None
+        if base_name in source_map:
+            matched = source_map[base_name]
+        else:
+            # Longest key first, so the first hit is the best match
+            for key in sorted_keys:
+                if key in base_name:
+                    matched = source_map[key]
+                    break
+        
+        if matched:
+            matched_srt, source_video = matched
+            videos_to_process.append((export_path, matched_srt, source_video))
+    export_thread.join()
 
     total_videos = len(videos_to_process)
     print(f"Found {total_videos} videos with matching source data.")
@@ -462,41 +734,56 @@ def main():
     already_processed_count = 0
     successful_log = []
     
-    # Process videos sequentially with optional cooldown delay
-    results = []
-    for i, (export_path, matched_srt) in enumerate(videos_to_process, 1):
-        task = (export_path, matched_srt, has_ffmpeg, force, delete_source, source_map, total_videos, i, no_subtitle)
-        result = process_single_video(task)
-        results.append(result)
-        
-        # Cooldown delay between files to reduce sustained SSD heat
-        if args.delay > 0 and i < total_videos and result != "already_processed":
-            safe_print(f"  Cooling down {args.delay}s before next file...")
-            time.sleep(args.delay)
+    # Start one exiftool process for the whole run
+    global _exiftool
+    _exiftool = ExifToolDaemon(_STATIC_EXIFTOOL_ARGS)
+
+    # Find already processed videos in one batched scan instead of per-file checks
+    processed_paths = set()
+    if not force:
+        processed_paths = check_if_processed([entry[0] for entry in videos_to_process], has_ffmpeg)
+
+    # Process videos in parallel; results are collected in match order so the
+    # summary lists files the same way on every run
+    start_logger()
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, args.threads)) as executor:
+            futures = []
+            for i, (export_path, matched_srt, source_video) in enumerate(videos_to_process, 1):
+                task = (export_path, matched_srt, has_ffmpeg, processed_paths, delete_source, source_video, total_videos, i, no_subtitle, args.delay)
+                futures.append(executor.submit(process_single_video, task))
+            
+            results = [future.result() for future in futures]
+    finally:
+        _exiftool.close()
+        stop_logger()
 
     # Tally results
-    for res in results:
-        if res.startswith("success"):
+    for status, entry in results:
+        if status == "success":
             processed_count += 1
-            successful_log.append(res.split('|')[1:])
-        elif res == "already_processed": 
+            successful_log.append(entry)
+        elif status == "already_processed": 
             already_processed_count += 1
         else: 
             skipped_count += 1
 
     # Write Summary Log
     log_path = os.path.join(export_dir, "injection_summary.txt")
-    with open(log_path, 'w', encoding='utf-8') as f:
-        f.write(f"DJI Metadata Injection Summary - {datetime.datetime.now()}\n")
-        f.write(f"====================================================\n\n")
-        f.write(f"Total Videos Matched: {total_videos}\n")
-        f.write(f"Successfully Processed: {processed_count}\n")
-        f.write(f"Skipped (Already Processed): {already_processed_count}\n")
-        f.write(f"Errors/No Match: {total_videos - processed_count - already_processed_count}\n\n")
-        f.write(f"Details of Processed Files:\n")
-        f.write(f"{'-'*50}\n")
-        for entry in successful_log:
-            f.write(f"File: {entry[0]} | Date: {entry[1]} | GPS: {entry[2]}\n")
+    # Build the whole report first and write it in one call
+    summary = (
+        f"DJI Metadata Injection Summary - {datetime.datetime.now()}\n"
+        f"====================================================\n\n"
+        f"Total Videos Matched: {total_videos}\n"
+        f"Successfully Processed: {processed_count}\n"
+        f"Skipped (Already Processed): {already_processed_count}\n"
+        f"Errors/No Match: {total_videos - processed_count - already_processed_count}\n\n"
+        f"Details of Processed Files:\n"
+        f"{'-'*50}\n"
+    )
+    details = "".join([f"File: {entry[0]} | Date: {entry[1]} | GPS: {entry[2]}\n" for entry in successful_log])
+    with open(log_path, 'w', encoding='utf-8', buffering=1024*1024) as f:
+        f.write(summary + details)
 
     # Save processed tracking file for fast future re-runs
     try:
@@ -505,6 +792,14 @@ def main():
     except Exception as e:
         print(f"Warning: Could not save tracking file: {e}")
 
+    # Save parsed SRT cache, dropping SRTs that are no longer in the source tree
+    seen_srts = {os.path.abspath(srt_path) for srt_path, _ in source_map.values()}
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump({key: entry for key, entry in _srt_cache.items() if key in seen_srts}, f)
+    except Exception as e:
+        print(f"Warning: Could not save SRT cache file: {e}")
+
     print(f"\nProcessing complete.")
     print(f"Processed (New): {processed_count}")
     print(f"Skipped (Already Processed): {already_processed_count}")
@@ -12,8 +12,8 @@ set SOURCE_DIR="C:\Path\To\Your\Source\Folder"
 set EXPORT_DIR="C:\Path\To\Your\Export\Folder"
 
 :: Options:
-:: --threads N        : Number of parallel threads (Default: 4, Recommended: 1 for HDD/SSD safety)
-:: --delay N          : Seconds to wait between files (Default: 5, Recommended: 5-10 for SSD cooldown)
+:: --threads N        : Number of parallel threads (Default: CPU count up to 8, Recommended: 1 for HDD/SSD safety)
+:: --delay N          : Seconds each thread waits between files it rewrites (Default: 5, Recommended: 5-10 for SSD cooldown; only a full pause with --threads 1)
 :: --no-subtitle      : Skip ffmpeg subtitle embedding (metadata only, saves 50% disk I/O)
 :: --delete-source    : Moves original source MP4 to Recycle Bin after successful processing (Space Saver)
 :: --force            : Re-process videos even if they already have metadata